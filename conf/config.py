@@ -7,6 +7,9 @@ class Settings(BaseSettings):
     BIND_IP: str
     BIND_PORT: int
     DB_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_STATEMENT_CACHE_SIZE: int = 512
 
     JWT_SECRET_SALT: str
     KAFKA_BOOTSTRAP_SERVERS: List[str]
@@ -17,6 +20,14 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: str
     REDIS_SIRIUS_CACHE_PREFIX: str = 'sirius'
     CACHE_EXPIRATION_TIME: int = 60
+    CACHE_LOCK_EXPIRATION_TIME: int = 5
+    # Параллельный запрос к БД при чтении сотрудника из кэша
+    # (включать при доле промахов кэша больше 50%)
+    CACHE_SPECULATIVE_FETCH: bool = False
+    # Минимальный размер списка в байтах для сжатия в кэше
+    CACHE_COMPRESS_MIN_SIZE: int = 1024
+    LOCAL_CACHE_MAXSIZE: int = 10_000
+    LOCAL_CACHE_EXPIRATION_TIME: float = 5
 
 
 settings = Settings()
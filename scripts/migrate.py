@@ -1,16 +1,25 @@
 import asyncio
 import logging
 
+from sqlalchemy import Connection
 from sqlalchemy.exc import IntegrityError
 
 from webapp.db.postgres import engine
 from webapp.models import meta
 
 
+# create_all не добавляет новые индексы в уже существующие таблицы
+def create_missing_indexes(conn: Connection) -> None:
+    for table in meta.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
 async def main() -> None:
     try:
         async with engine.begin() as conn:
             await conn.run_sync(meta.metadata.create_all)
+            await conn.run_sync(create_missing_indexes)
     except IntegrityError:
         logging.exception('Already exists')
 
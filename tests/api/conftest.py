@@ -15,16 +15,29 @@ from tests.const import URLS
 from tests.mocking.kafka import TestKafkaProducer
 from tests.my_types import FixtureFunctionT
 
+from webapp.cache.local import local_cache
 from webapp.db import kafka
 from webapp.db.postgres import engine, get_session
 from webapp.db.redis import get_redis
 from webapp.models.meta import metadata
 
 
+@pytest.fixture(autouse=True)
+def _clear_local_cache() -> None:
+    local_cache.clear()
+
+
 @pytest.fixture()
 def redis_mock():
     mock_redis = mock.AsyncMock()
     mock_redis.get.return_value = None
+    mock_redis.zrange.return_value = []
+
+    # pipeline() в redis.asyncio синхронный и возвращает контекстный менеджер
+    mock_pipeline = mock.MagicMock()
+    mock_pipeline.__aenter__.return_value = mock_pipeline
+    mock_pipeline.execute = mock.AsyncMock(return_value=[])
+    mock_redis.pipeline = mock.MagicMock(return_value=mock_pipeline)
     return mock_redis
 
 
@@ -6,6 +6,8 @@ from starlette import status
 
 from tests.const import URLS
 
+from webapp.cache.key_builder import EMPLOYEE_LIST_INDEX_KEY
+
 BASE_DIR = Path(__file__).parent
 FIXTURES_PATH = BASE_DIR / 'fixtures'
 
@@ -27,6 +29,7 @@ FIXTURES_PATH = BASE_DIR / 'fixtures'
 @pytest.mark.usefixtures('_common_api_fixture')
 async def test_create_employee(
     client: AsyncClient,
+    redis_mock,
     name: str,
     user_id: int,
     expected_status: int,
@@ -40,3 +43,7 @@ async def test_create_employee(
     response_data = response.json()
     assert response_data['name'] == name
     assert response_data['user_id'] == user_id
+    # Закэшированные страницы списка сотрудников инвалидируются
+    redis_mock.pipeline.return_value.zrange.assert_called_once_with(
+        EMPLOYEE_LIST_INDEX_KEY, 0, -1
+    )
@@ -2,10 +2,17 @@ from pathlib import Path
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from tests.const import URLS
 
+from webapp.cache.key_builder import get_vacation_cache_key
+from webapp.models.sirius.employee import Employee
+from webapp.models.sirius.user import User
+from webapp.models.sirius.vacation import Vacation
+
 BASE_DIR = Path(__file__).parent
 FIXTURES_PATH = BASE_DIR / 'fixtures'
 
@@ -20,7 +27,24 @@ FIXTURES_PATH = BASE_DIR / 'fixtures'
                 FIXTURES_PATH / 'sirius.user.json',
                 FIXTURES_PATH / 'sirius.employee.json',
             ],
-        )
+        ),
+        (
+            1,
+            status.HTTP_204_NO_CONTENT,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+        (
+            999,
+            status.HTTP_404_NOT_FOUND,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+            ],
+        ),
     ],
 )
 @pytest.mark.asyncio()
@@ -35,3 +59,53 @@ async def test_delete_employee(
     )
 
     assert response.status_code == expected_status
+
+
+@pytest.mark.parametrize(
+    ('employee_id', 'user_id', 'expected_status', 'fixtures'),
+    [
+        (
+            1,
+            1,
+            status.HTTP_204_NO_CONTENT,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        )
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_delete_employee_with_vacations(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    redis_mock,
+    employee_id: int,
+    user_id: int,
+    expected_status: int,
+) -> None:
+    vacation_ids = (
+        await db_session.scalars(
+            select(Vacation.id).where(Vacation.employee_id == employee_id)
+        )
+    ).all()
+
+    response = await client.delete(
+        URLS['employee']['get_delete_patch'].format(employee_id=employee_id)
+    )
+
+    assert response.status_code == expected_status
+    # Вместе с сотрудником удаляются его отпуска и учетная запись
+    vacations = await db_session.scalars(
+        select(Vacation).where(Vacation.employee_id == employee_id)
+    )
+    assert vacations.all() == []
+    assert await db_session.get(Employee, employee_id) is None
+    assert await db_session.get(User, user_id) is None
+    # Кэш удаленных отпусков инвалидируется вместе с кэшем сотрудника
+    deleted_keys = redis_mock.pipeline.return_value.delete.call_args.args
+    assert vacation_ids
+    for vacation_id in vacation_ids:
+        assert get_vacation_cache_key(vacation_id) in deleted_keys
@@ -45,3 +45,76 @@ async def test_get_employee_by_id(
     assert response_data['name'] == name
     assert response_data['user_id'] == user_id
     assert response_data['vacations'][0]['employee_id'] == employee_id
+
+
+@pytest.mark.parametrize(
+    ('employee_id', 'fixtures'),
+    [
+        (
+            1,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        )
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_employee_by_id_from_local_cache(
+    client: AsyncClient,
+    redis_mock,
+    employee_id: int,
+) -> None:
+    url = URLS['employee']['get_delete_patch'].format(employee_id=employee_id)
+    first_response = await client.get(url)
+    second_response = await client.get(url)
+
+    assert second_response.status_code == status.HTTP_200_OK
+    assert second_response.json() == first_response.json()
+    # Повторный запрос обслуживается из памяти процесса без обращения к Redis
+    redis_mock.get.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ('params', 'expected_ids', 'fixtures'),
+    [
+        (
+            {'offset': 0, 'limit': 10},
+            [1],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+        (
+            {'after_id': 0, 'limit': 10},
+            [1],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+        (
+            {'after_id': 1, 'limit': 10},
+            [],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_employees_pagination(
+    client: AsyncClient, params: dict, expected_ids: list
+) -> None:
+    response = await client.get(URLS['employee']['list'], params=params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [employee['id'] for employee in response.json()] == expected_ids
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+
+@pytest.mark.parametrize(
+    ('employee_id', 'name', 'user_id', 'expected_status', 'fixtures'),
+    [
+        (
+            1,
+            'John Smith',
+            1,
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        )
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_patch_employee(
+    client: AsyncClient,
+    employee_id: int,
+    name: str,
+    user_id: int,
+    expected_status: int,
+) -> None:
+    response = await client.patch(
+        URLS['employee']['get_delete_patch'].format(employee_id=employee_id),
+        json={'name': name, 'user_id': user_id},
+    )
+
+    assert response.status_code == expected_status
+    response_data = response.json()
+    assert response_data['id'] == employee_id
+    assert response_data['name'] == name
+    assert response_data['user_id'] == user_id
+    # Отпуска загружаются после UPDATE ... RETURNING
+    assert len(response_data['vacations']) == 2
+    assert all(
+        vacation['employee_id'] == employee_id
+        for vacation in response_data['vacations']
+    )
+
+
+@pytest.mark.parametrize(
+    ('employee_id', 'expected_status', 'fixtures'),
+    [
+        (
+            999,
+            status.HTTP_404_NOT_FOUND,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+            ],
+        )
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_patch_employee_not_found(
+    client: AsyncClient,
+    employee_id: int,
+    expected_status: int,
+) -> None:
+    response = await client.patch(
+        URLS['employee']['get_delete_patch'].format(employee_id=employee_id),
+        json={'name': 'Nobody', 'user_id': 1},
+    )
+
+    assert response.status_code == expected_status
+    assert response.json()['detail'] == 'Employee not found'
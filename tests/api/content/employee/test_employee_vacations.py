@@ -45,3 +45,37 @@ async def test_get_employee_by_id(
     assert response_data[0]['approved'] == approved
     assert response_data[1]['employee_id'] == employee_id
     assert response_data[1]['approved'] == approved
+
+
+@pytest.mark.parametrize(
+    ('employee_id', 'fixtures'),
+    [
+        (
+            1,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        )
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_vacations_for_employee_after_id(
+    client: AsyncClient, employee_id: int
+) -> None:
+    url = URLS['employee']['get_vacations_for_employee'].format(
+        employee_id=employee_id
+    )
+    first_page = (await client.get(url, params={'limit': 1})).json()
+    second_page = (
+        await client.get(
+            url, params={'after_id': first_page[0]['id'], 'limit': 1}
+        )
+    ).json()
+    all_vacations = (await client.get(url)).json()
+
+    assert len(first_page) == len(second_page) == 1
+    assert second_page[0]['id'] > first_page[0]['id']
+    assert all_vacations == first_page + second_page
@@ -92,3 +92,35 @@ async def test_update_vacation_approval_endpoint(
     response_data = response.json()
     assert response_data['id'] == vacation_id
     assert response_data['approved'] == approved
+
+
+@pytest.mark.parametrize(
+    ('vacation_id', 'approved', 'expected_status', 'fixtures'),
+    [
+        (
+            999,
+            True,
+            status.HTTP_404_NOT_FOUND,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_update_vacation_approval_endpoint_not_found(
+    client: AsyncClient,
+    vacation_id: int,
+    approved: bool,
+    expected_status: int,
+) -> None:
+    response = await client.put(
+        URLS['vacation']['approval'].format(vacation_id=vacation_id),
+        params={'approved': approved},
+    )
+
+    assert response.status_code == expected_status
+    assert response.json()['detail'] == 'Vacation not found'
@@ -6,15 +6,18 @@ from starlette import status
 
 from tests.const import URLS
 
+from webapp.cache.key_builder import get_employee_cache_key
+
 BASE_DIR = Path(__file__).parent
 FIXTURES_PATH = BASE_DIR / 'fixtures'
 
 
 @pytest.mark.parametrize(
-    ('vacation_id', 'expected_status', 'fixtures'),
+    ('vacation_id', 'employee_id', 'expected_status', 'fixtures'),
     [
         (
             3,
+            2,
             status.HTTP_204_NO_CONTENT,
             [
                 FIXTURES_PATH / 'sirius.user.json',
@@ -24,6 +27,7 @@ FIXTURES_PATH = BASE_DIR / 'fixtures'
         ),
         (
             4,
+            2,
             status.HTTP_204_NO_CONTENT,
             [
                 FIXTURES_PATH / 'sirius.user.json',
@@ -33,6 +37,7 @@ FIXTURES_PATH = BASE_DIR / 'fixtures'
         ),
         (
             7,
+            4,
             status.HTTP_204_NO_CONTENT,
             [
                 FIXTURES_PATH / 'sirius.user.json',
@@ -45,7 +50,11 @@ FIXTURES_PATH = BASE_DIR / 'fixtures'
 @pytest.mark.asyncio()
 @pytest.mark.usefixtures('_common_api_fixture')
 async def test_delete_vacation_endpoint(
-    client: AsyncClient, vacation_id: int, expected_status: int
+    client: AsyncClient,
+    redis_mock,
+    vacation_id: int,
+    employee_id: int,
+    expected_status: int,
 ) -> None:
     response = await client.delete(
         URLS['vacation']['get_by_id_and_delete'].format(
@@ -54,3 +63,6 @@ async def test_delete_vacation_endpoint(
     )
 
     assert response.status_code == expected_status
+    # Кэш сотрудника содержит его отпуска и должен быть инвалидирован
+    deleted_keys = redis_mock.pipeline.return_value.delete.call_args.args
+    assert get_employee_cache_key(employee_id) in deleted_keys
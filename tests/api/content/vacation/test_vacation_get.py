@@ -60,3 +60,32 @@ async def test_get_vacation_endpoint(
     response_data = response.json()
     assert response_data['id'] == vacation_id
     assert response_data['approved'] == approved
+
+
+@pytest.mark.parametrize(
+    ('vacation_id', 'expected_status', 'fixtures'),
+    [
+        (
+            999,
+            status.HTTP_404_NOT_FOUND,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_vacation_endpoint_not_found(
+    client: AsyncClient, vacation_id: int, expected_status: int
+) -> None:
+    response = await client.get(
+        URLS['vacation']['get_by_id_and_delete'].format(
+            vacation_id=vacation_id
+        )
+    )
+
+    assert response.status_code == expected_status
+    assert response.json()['detail'] == 'Vacation not found'
@@ -42,3 +42,37 @@ async def test_get_pending_vacations_endpoint(
     assert response_data[0]['approved'] == approved
     assert response_data[0]['id'] == vacation_id
     assert response_data[0]['employee_id'] == employee_id
+
+
+@pytest.mark.parametrize(
+    ('params', 'expected_ids', 'fixtures'),
+    [
+        (
+            {'offset': 2, 'limit': 2},
+            [5, 7],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+        (
+            {'after_id': 5, 'limit': 2},
+            [7, 11],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_pending_vacations_pagination(
+    client: AsyncClient, params: dict, expected_ids: list
+) -> None:
+    response = await client.get(URLS['vacation']['pending'], params=params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [vacation['id'] for vacation in response.json()] == expected_ids
@@ -6,6 +6,9 @@ from starlette import status
 
 from tests.const import URLS
 
+from conf.config import settings
+from webapp.cache.key_builder import get_vacation_list_cache_key
+
 BASE_DIR = Path(__file__).parent
 FIXTURES_PATH = BASE_DIR / 'fixtures'
 
@@ -34,3 +37,141 @@ async def test_get_vacations_endpoint(
     )
 
     assert response.status_code == expected_status
+
+
+@pytest.mark.parametrize(
+    ('params', 'expected_ids', 'fixtures'),
+    [
+        (
+            {'approved': True, 'offset': 0, 'limit': 3},
+            [3, 6, 9],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+        (
+            {'approved': True, 'offset': 3, 'limit': 3},
+            [10, 12, 13],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+        (
+            {'approved': True, 'after_id': 9, 'limit': 3},
+            [10, 12, 13],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+        (
+            {'approved': True, 'after_id': 20, 'limit': 3},
+            [],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_vacations_pagination(
+    client: AsyncClient, params: dict, expected_ids: list
+) -> None:
+    response = await client.get(URLS['vacation']['get_post'], params=params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [vacation['id'] for vacation in response.json()] == expected_ids
+
+
+@pytest.mark.parametrize(
+    'fixtures',
+    [
+        [
+            FIXTURES_PATH / 'sirius.user.json',
+            FIXTURES_PATH / 'sirius.employee.json',
+            FIXTURES_PATH / 'sirius.vacation.json',
+        ],
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_vacations_cache_key_depends_on_cursor(
+    client: AsyncClient, redis_mock
+) -> None:
+    await client.get(
+        URLS['vacation']['get_post'], params={'offset': 0, 'limit': 3}
+    )
+    await client.get(
+        URLS['vacation']['get_post'], params={'after_id': 0, 'limit': 3}
+    )
+
+    offset_key = get_vacation_list_cache_key(None, skip=0, limit=3)
+    cursor_key = get_vacation_list_cache_key(None, skip=0, limit=3, after_id=0)
+    assert offset_key != cursor_key
+    requested_keys = [call.args[0] for call in redis_mock.get.call_args_list]
+    assert requested_keys == [offset_key, cursor_key]
+
+
+@pytest.mark.parametrize(
+    ('accept_encoding', 'content_encoding', 'fixtures'),
+    [
+        (
+            'gzip, deflate',
+            'deflate',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+        (
+            'identity',
+            None,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+        (
+            'gzip, deflate;q=0',
+            None,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.employee.json',
+                FIXTURES_PATH / 'sirius.vacation.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_vacations_compressed_payload(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+    accept_encoding: str,
+    content_encoding: str | None,
+) -> None:
+    # Список из фикстур больше порога и хранится в кэше сжатым
+    monkeypatch.setattr(settings, 'CACHE_COMPRESS_MIN_SIZE', 256)
+
+    response = await client.get(
+        URLS['vacation']['get_post'],
+        params={'approved': True, 'limit': 20},
+        headers={'Accept-Encoding': accept_encoding},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers.get('content-encoding') == content_encoding
+    assert response.headers['vary'] == 'Accept-Encoding'
+    response_data = response.json()
+    assert len(response_data) == 11
+    assert all(vacation['approved'] for vacation in response_data)
@@ -0,0 +1,15 @@
+import pytest
+
+from tests.mocking.redis import TestRedis
+
+from webapp.cache.local import local_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_local_cache() -> None:
+    local_cache.clear()
+
+
+@pytest.fixture()
+def redis() -> TestRedis:
+    return TestRedis()
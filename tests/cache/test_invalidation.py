@@ -0,0 +1,62 @@
+import pytest
+
+from tests.mocking.redis import TestRedis
+
+from webapp.cache import single_flight
+from webapp.cache.invalidation import invalidate_cache
+from webapp.cache.local import local_cache
+
+INDEX_KEY = 'test:index'
+TTL = 60
+
+
+@pytest.mark.asyncio()
+async def test_index_drops_expired_keys_on_write(
+    redis: TestRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(single_flight.time, 'time', lambda: 1000.0)
+    await single_flight._store(redis, 'test:first', b'1', TTL, INDEX_KEY)
+    await single_flight._store(redis, 'test:second', b'2', TTL, INDEX_KEY)
+
+    # Ключи test:first и test:second истекли к моменту следующей записи
+    monkeypatch.setattr(single_flight.time, 'time', lambda: 1000.0 + TTL + 1)
+    await single_flight._store(redis, 'test:third', b'3', TTL, INDEX_KEY)
+
+    assert await redis.zrange(INDEX_KEY, 0, -1) == ['test:third']
+    assert redis.ttl[INDEX_KEY] == TTL
+
+
+@pytest.mark.asyncio()
+async def test_invalidate_cache_deletes_indexed_keys(
+    redis: TestRedis,
+) -> None:
+    await single_flight._store(redis, 'test:list:1', b'[]', TTL, INDEX_KEY)
+    await single_flight._store(redis, 'test:list:2', b'[]', TTL, INDEX_KEY)
+    await redis.set('test:entity', b'{}')
+    await redis.set('test:other', b'{}')
+    local_cache.set('test:entity', b'{}')
+
+    await invalidate_cache(redis, ['test:entity'], index_keys=[INDEX_KEY])
+
+    assert set(redis.data) == {'test:other'}
+    assert local_cache.get('test:entity') is None
+
+
+@pytest.mark.asyncio()
+async def test_invalidate_cache_keeps_keys_indexed_after_read(
+    redis: TestRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await single_flight._store(redis, 'test:list:1', b'[]', TTL, INDEX_KEY)
+    original_zrange = redis.zrange
+
+    # Страница записывается в кэш между чтением индекса и удалением ключей
+    async def zrange_then_store(key: str, start: int, end: int) -> list:
+        members = await original_zrange(key, start, end)
+        await single_flight._store(redis, 'test:list:2', b'[]', TTL, INDEX_KEY)
+        return members
+
+    monkeypatch.setattr(redis, 'zrange', zrange_then_store)
+    await invalidate_cache(redis, index_keys=[INDEX_KEY])
+
+    assert 'test:list:1' not in redis.data
+    assert await original_zrange(INDEX_KEY, 0, -1) == ['test:list:2']
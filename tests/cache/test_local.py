@@ -0,0 +1,34 @@
+import pytest
+
+from webapp.cache import local
+from webapp.cache.local import LocalTTLCache
+
+TTL = 60
+
+
+def test_local_cache_expires_after_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = LocalTTLCache(maxsize=10, ttl=TTL)
+    monkeypatch.setattr(local, 'monotonic', lambda: 1000.0)
+    cache.set('test:key', b'1')
+
+    monkeypatch.setattr(local, 'monotonic', lambda: 1000.0 + TTL - 1)
+    assert cache.get('test:key') == b'1'
+
+    monkeypatch.setattr(local, 'monotonic', lambda: 1000.0 + TTL)
+    assert cache.get('test:key') is None
+
+
+def test_local_cache_evicts_least_recently_used() -> None:
+    cache = LocalTTLCache(maxsize=2, ttl=TTL)
+    cache.set('test:first', b'1')
+    cache.set('test:second', b'2')
+
+    # Чтение делает test:first последним использованным ключом
+    assert cache.get('test:first') == b'1'
+    cache.set('test:third', b'3')
+
+    assert cache.get('test:second') is None
+    assert cache.get('test:first') == b'1'
+    assert cache.get('test:third') == b'3'
@@ -0,0 +1,197 @@
+import asyncio
+
+import pytest
+
+from tests.mocking.redis import TestRedis
+
+from webapp.cache import single_flight
+from webapp.cache.key_builder import get_cache_lock_key
+from webapp.cache.single_flight import cached_or_fetch
+
+CACHE_KEY = 'test:cache_key'
+LOCK_KEY = get_cache_lock_key(CACHE_KEY)
+TTL = 60
+
+
+async def _wait_background_tasks() -> None:
+    while single_flight._background_tasks:
+        await asyncio.gather(*single_flight._background_tasks)
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_misses_fetch_once(redis: TestRedis) -> None:
+    calls = 0
+
+    async def fetcher() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b'payload'
+
+    results = await asyncio.gather(
+        *(cached_or_fetch(redis, CACHE_KEY, fetcher, TTL) for _ in range(10))
+    )
+    await _wait_background_tasks()
+
+    assert calls == 1
+    assert results == [b'payload'] * 10
+    assert redis.data[CACHE_KEY] == b'payload'
+    assert redis.ttl[CACHE_KEY] == TTL
+    assert LOCK_KEY not in redis.data
+
+
+@pytest.mark.asyncio()
+async def test_waiter_gets_value_stored_by_lock_owner(
+    redis: TestRedis,
+) -> None:
+    # Блокировку удерживает другой процесс
+    await redis.set(LOCK_KEY, 1)
+
+    async def fetcher() -> bytes:
+        raise AssertionError('Fetcher must not be called')
+
+    async def other_process() -> None:
+        await asyncio.sleep(0.05)
+        await redis.set(CACHE_KEY, b'payload')
+        await redis.delete(LOCK_KEY)
+
+    result, _ = await asyncio.gather(
+        cached_or_fetch(redis, CACHE_KEY, fetcher, TTL), other_process()
+    )
+
+    assert result == b'payload'
+
+
+@pytest.mark.asyncio()
+async def test_failing_fetcher_releases_lock(redis: TestRedis) -> None:
+    async def fetcher() -> bytes:
+        raise RuntimeError('Database is unavailable')
+
+    with pytest.raises(RuntimeError):
+        await cached_or_fetch(redis, CACHE_KEY, fetcher, TTL)
+    await _wait_background_tasks()
+
+    assert LOCK_KEY not in redis.data
+    assert CACHE_KEY not in redis.data
+    assert CACHE_KEY not in single_flight._inflight
+
+
+@pytest.mark.asyncio()
+async def test_waiter_retries_when_owner_is_cancelled(
+    redis: TestRedis,
+) -> None:
+    calls = 0
+    never = asyncio.Event()
+
+    async def fetcher() -> bytes:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await never.wait()
+        return b'payload'
+
+    owner = asyncio.create_task(
+        cached_or_fetch(redis, CACHE_KEY, fetcher, TTL)
+    )
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(
+        cached_or_fetch(redis, CACHE_KEY, fetcher, TTL)
+    )
+    await asyncio.sleep(0.01)
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+    assert await waiter == b'payload'
+    assert calls == 2
+    await _wait_background_tasks()
+    assert redis.data[CACHE_KEY] == b'payload'
+
+
+@pytest.mark.asyncio()
+async def test_none_result_is_not_cached(redis: TestRedis) -> None:
+    calls = 0
+
+    async def fetcher() -> None:
+        nonlocal calls
+        calls += 1
+        return None
+
+    assert await cached_or_fetch(redis, CACHE_KEY, fetcher, TTL) is None
+    await _wait_background_tasks()
+    assert await cached_or_fetch(redis, CACHE_KEY, fetcher, TTL) is None
+    await _wait_background_tasks()
+
+    assert calls == 2
+    assert CACHE_KEY not in redis.data
+    assert LOCK_KEY not in redis.data
+
+
+@pytest.mark.asyncio()
+async def test_speculative_hit_discards_fetch(redis: TestRedis) -> None:
+    await redis.set(CACHE_KEY, b'cached')
+    finished = False
+
+    async def fetcher() -> bytes:
+        nonlocal finished
+        await asyncio.sleep(0.01)
+        finished = True
+        return b'payload'
+
+    result = await cached_or_fetch(
+        redis, CACHE_KEY, fetcher, TTL, speculative=True
+    )
+    # Запрос к источнику не отменяется, а завершается в фоне
+    await _wait_background_tasks()
+
+    assert result == b'cached'
+    assert finished
+    assert redis.data[CACHE_KEY] == b'cached'
+
+
+@pytest.mark.asyncio()
+async def test_speculative_miss_returns_and_stores_payload(
+    redis: TestRedis,
+) -> None:
+    async def fetcher() -> bytes:
+        return b'payload'
+
+    result = await cached_or_fetch(
+        redis, CACHE_KEY, fetcher, TTL, speculative=True
+    )
+    await _wait_background_tasks()
+
+    assert result == b'payload'
+    assert redis.data[CACHE_KEY] == b'payload'
+    assert redis.ttl[CACHE_KEY] == TTL
+
+
+@pytest.mark.asyncio()
+async def test_speculative_redis_error_cancels_fetch(
+    redis: TestRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cancelled = False
+    started = asyncio.Event()
+
+    async def fetcher() -> bytes:
+        nonlocal cancelled
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return b'payload'
+
+    async def broken_get(key: str) -> bytes:
+        await started.wait()
+        raise ConnectionError('Redis is unavailable')
+
+    monkeypatch.setattr(redis, 'get', broken_get)
+
+    with pytest.raises(ConnectionError):
+        await cached_or_fetch(redis, CACHE_KEY, fetcher, TTL, speculative=True)
+
+    assert cancelled
+    assert not single_flight._background_tasks
@@ -34,8 +34,12 @@ def event_loop():
     return asyncio.get_event_loop()
 
 
+# Зависимость от _run_after_tests гарантирует, что данные загружаются уже
+# после пересоздания таблиц, даже если последний тест не использует БД
 @pytest.fixture(scope='session')
-async def _migrate_db() -> FixtureFunctionT:
+async def _migrate_db(
+    _run_after_tests: FixtureFunctionT,
+) -> FixtureFunctionT:
     async with engine.begin() as conn:
         await conn.run_sync(meta.metadata.drop_all)
         await conn.run_sync(meta.metadata.create_all)
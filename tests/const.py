@@ -5,6 +5,7 @@ URLS = {
     },
     'employee': {
         'create': '/employees',
+        'list': '/employees',
         'get_delete_patch': '/employees/{employee_id}',
         'get_vacations_for_employee': '/employees/{employee_id}/vacations',
     },
@@ -0,0 +1,102 @@
+from typing import Any, Dict, List, Tuple
+
+
+class TestRedis:
+    """Хранилище в памяти с подмножеством команд redis.asyncio.Redis."""
+
+    __test__ = False
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Any] = {}
+        self.ttl: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(
+        self, key: str, value: Any, ex: int | None = None, nx: bool = False
+    ) -> bool | None:
+        if nx and key in self.data:
+            return None
+        if not isinstance(value, bytes):
+            value = str(value).encode()
+        self.data[key] = value
+        if ex is not None:
+            self.ttl[key] = ex
+        return True
+
+    async def exists(self, *keys: str) -> int:
+        return sum(key in self.data for key in keys)
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            self.ttl.pop(key, None)
+            deleted += self.data.pop(key, None) is not None
+        return deleted
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        if key not in self.data:
+            return False
+        self.ttl[key] = seconds
+        return True
+
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        current = self.data.setdefault(key, {})
+        added = len(mapping.keys() - current.keys())
+        current.update(mapping)
+        return added
+
+    async def zremrangebyscore(
+        self, key: str, min: float | str, max: float | str
+    ) -> int:
+        current = self.data.get(key, {})
+        low, high = float(min), float(max)
+        removed = [m for m, score in current.items() if low <= score <= high]
+        for member in removed:
+            del current[member]
+        return len(removed)
+
+    async def zrem(self, key: str, *members: str) -> int:
+        current = self.data.get(key, {})
+        removed = 0
+        for member in members:
+            removed += current.pop(member, None) is not None
+        if key in self.data and not current:
+            await self.delete(key)
+        return removed
+
+    async def zrange(self, key: str, start: int, end: int) -> List[str]:
+        members = sorted(self.data.get(key, {}).items(), key=lambda i: i[1])
+        end = len(members) if end == -1 else end + 1
+        return [member for member, _ in members[start:end]]
+
+    def pipeline(self, transaction: bool = True) -> 'TestRedisPipeline':
+        return TestRedisPipeline(self)
+
+
+class TestRedisPipeline:
+    __test__ = False
+
+    def __init__(self, redis: TestRedis) -> None:
+        self.redis = redis
+        self.commands: List[Tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> 'TestRedisPipeline':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.commands.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        def command(*args: Any, **kwargs: Any) -> 'TestRedisPipeline':
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return command
+
+    async def execute(self) -> List[Any]:
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
@@ -1,35 +1,56 @@
-from typing import List, Sequence  # Импорт типов для аннотаций
+from typing import List, Optional, Sequence  # Импорт типов для аннотаций
 
-import orjson  # Импорт библиотеки для сериализации/десериализации JSON
-from fastapi import Depends, HTTPException, Query, status  # Импорт классов и функций FastAPI
+from fastapi import Depends, HTTPException, Query, Request, status  # Импорт классов и функций FastAPI
 from fastapi.responses import ORJSONResponse  # Импорт класса для создания JSON-ответов
+from pydantic import TypeAdapter  # Импорт адаптера для сериализации коллекций Pydantic моделей
 from redis.asyncio import Redis  # Импорт асинхронного клиента Redis
 from sqlalchemy.ext.asyncio import AsyncSession  # Импорт асинхронной сессии SQLAlchemy
 
 from conf.config import settings  # Импорт настроек приложения
 from webapp.api.employee.router import employee_router  # Импорт роутера для сотрудников
-from webapp.cache.key_builder import get_employee_cache_key  # Импорт функции для получения ключа кэша сотрудника
+from webapp.cache.compression import compress_payload  # Импорт функции для сжатия данных кэша
+from webapp.cache.invalidation import invalidate_cache  # Импорт функции для инвалидации кэша
+from webapp.cache.key_builder import (  # Импорт функций для построения ключей кэша
+    EMPLOYEE_LIST_INDEX_KEY,
+    VACATION_LIST_INDEX_KEY,
+    get_employee_cache_key,
+    get_employee_list_cache_key,
+    get_vacation_cache_key,
+)
+from webapp.cache.single_flight import cached_or_fetch  # Импорт функции для получения данных из кэша или базы данных
 from webapp.crud.employee import (  # Импорт функций для выполнения операций CRUD с сотрудниками
     create_employee,
     delete_employee,
     get_employee,
-    get_employees,
+    get_employees_light,
     get_vacations_for_employee,
     update_employee,
 )
-from webapp.db.postgres import get_session  # Импорт функции для получения асинхронной сессии PostgreSQL
+from webapp.db.postgres import (  # Импорт фабрики и функции для получения асинхронной сессии PostgreSQL
+    async_session,
+    get_session,
+)
 from webapp.db.redis import get_redis  # Импорт функции для получения асинхронного клиента Redis
 from webapp.schema.employee.employee import (  # Импорт моделей сотрудников
     Employee,
     EmployeeCreate,
+    EmployeeListItem,
     EmployeeUpdate,
 )
 from webapp.schema.vacation.vacation import Vacation  # Импорт модели отпусков
 from webapp.utils.decorator import measure_integration_latency  # Импорт декоратора для измерения времени выполнения
+from webapp.utils.response import (  # Импорт классов и функций для отдачи готового JSON
+    RawJSONResponse,
+    cached_json_response,
+)
+
+# Адаптеры для сериализации сотрудников сразу в байты JSON
+_EMP_ADAPTER = TypeAdapter(Employee)
+_EMP_LIST_ADAPTER = TypeAdapter(List[EmployeeListItem])
 
 
 # Создание учетной записи нового сотрудника
-# После создания сотрудника - его данные могут быть сохранены в кэше (не реализовано в данном коде)
+# После создания сотрудника инвалидируются закэшированные страницы списка
 @measure_integration_latency(
     method_name='create_employee_endpoint', integration_point='endpoint'
 )
@@ -43,59 +64,69 @@ from webapp.utils.decorator import measure_integration_latency  # Импорт 
 async def create_employee_endpoint(
     employee_data: EmployeeCreate,
     session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(get_redis),
 ) -> EmployeeCreate:
     created_employee = await create_employee(
         session=session, employee_data=employee_data
     )
+    # Новый сотрудник должен появиться в списке, а не ждать истечения кэша
+    await invalidate_cache(redis, index_keys=[EMPLOYEE_LIST_INDEX_KEY])
     return created_employee
 
 
-# Получение списка всех сотрудников
+# Получение списка всех сотрудников (без отпусков)
+# Для следующей страницы передается after_id - id последнего сотрудника
 # При наличии кэшированных данных возвращает их, иначе делает запрос к базе данных
 @measure_integration_latency(
     method_name='get_employees_endpoint', integration_point='endpoint'
 )
 @employee_router.get(
     '/',
-    response_model=List[Employee],
+    responses={200: {'model': List[EmployeeListItem]}},
     tags=['Employee'],
     response_class=ORJSONResponse,
 )
 async def get_employees_endpoint(
+    request: Request,
     session: AsyncSession = Depends(get_session),
     skip: int = Query(0, alias='offset'),
     limit: int = Query(10, alias='limit'),
+    after_id: Optional[int] = Query(None, alias='after_id'),
     redis: Redis = Depends(get_redis),
-) -> List[Employee]:
+) -> RawJSONResponse:
     # Генерация ключа кэша для списка сотрудников
-    cache_key = f'employee_{skip}_{limit}'
-    # Проверка наличия данных в кэше
-    cached_data = await redis.get(cache_key)
-
-    if cached_data:
-        # Возврат данных из кэша, если они есть
-        return orjson.loads(cached_data)
-
-    # Запрос данных из базы данных
-    employees = await get_employees(session=session, skip=skip, limit=limit)
-    # Сохранение данных в кэше
-    await redis.set(
-        cache_key,
-        orjson.dumps([emp.model_dump() for emp in employees]),
-        ex=settings.CACHE_EXPIRATION_TIME,
+    cache_key = get_employee_list_cache_key(
+        skip=skip, limit=limit, after_id=after_id
     )
 
-    return employees
+    # Запрос данных из базы данных при отсутствии их в кэше
+    async def fetch_employees() -> bytes:
+        employees = await get_employees_light(
+            session=session, skip=skip, limit=limit, after_id=after_id
+        )
+        return compress_payload(_EMP_LIST_ADAPTER.dump_json(employees))
+
+    # Данные из кэша возвращаются как есть, без повторной сериализации
+    payload = await cached_or_fetch(
+        redis,
+        cache_key,
+        fetch_employees,
+        settings.CACHE_EXPIRATION_TIME,
+        index_key=EMPLOYEE_LIST_INDEX_KEY,
+    )
+    return cached_json_response(payload, request)
 
 
 # Частичное обновление данных о сотруднике
-# После обновления сотрудника, его данные могут быть обновлены в кэше (не реализовано в данном коде)
+# После обновления сотрудника его кэш и закэшированные страницы списка
+# инвалидируются. Ответ сериализуется сразу в байты JSON, без повторной
+# валидации через response_model.
 @measure_integration_latency(
     method_name='patch_employee_endpoint', integration_point='endpoint'
 )
 @employee_router.patch(
     '/{employee_id}',
-    response_model=Employee,
+    responses={200: {'model': Employee}},
     tags=['Employee'],
     response_class=ORJSONResponse,
 )
@@ -104,16 +135,25 @@ async def patch_employee_endpoint(
     employee_data: EmployeeUpdate,
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),  # Добавляем зависимость от Redis
-) -> Employee:
-    # Очистка кэша сотрудника, так как его данные обновляются
-    cache_key = get_employee_cache_key(employee_id)
-    await redis.delete(cache_key)
-
-    return await update_employee(
+) -> RawJSONResponse:
+    employee = await update_employee(
         session=session,
         employee_id=employee_id,
         update_data=employee_data.model_dump(exclude_unset=True),
     )
+    if not employee:
+        raise HTTPException(status_code=404, detail='Employee not found')
+
+    # Очистка кэша сотрудника и списков сотрудников после записи в БД:
+    # при очистке до записи параллельный запрос успел бы закэшировать
+    # старые данные
+    await invalidate_cache(
+        redis,
+        [get_employee_cache_key(employee_id)],
+        index_keys=[EMPLOYEE_LIST_INDEX_KEY],
+    )
+
+    return RawJSONResponse(_EMP_ADAPTER.dump_json(employee))
 
 
 # Получение списка отпусков для конкретного сотрудника
@@ -132,9 +172,14 @@ async def get_vacations_for_employee_endpoint(
     session: AsyncSession = Depends(get_session),
     skip: int = Query(0, alias='offset'),
     limit: int = Query(10, alias='limit'),
+    after_id: Optional[int] = Query(None, alias='after_id'),
 ) -> Sequence[Vacation]:
     return await get_vacations_for_employee(
-        session=session, employee_id=employee_id, skip=skip, limit=limit
+        session=session,
+        employee_id=employee_id,
+        skip=skip,
+        limit=limit,
+        after_id=after_id,
     )
 
 
@@ -145,7 +190,7 @@ async def get_vacations_for_employee_endpoint(
 )
 @employee_router.get(
     '/{employee_id}',
-    response_model=Employee,
+    responses={200: {'model': Employee}},
     tags=['Employee'],
     response_class=ORJSONResponse,
 )
@@ -153,29 +198,39 @@ async def get_employee_endpoint(
     employee_id: int,
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),  # Добавляем зависимость от Redis
-) -> Employee:
+) -> RawJSONResponse:
     # Генерация ключа кэша для сотрудника
     cache_key = get_employee_cache_key(employee_id)
-    # Проверка наличия данных о сотруднике в кэше
-    cached_data = await redis.get(cache_key)
 
-    if cached_data:
-        # Возврат данных о сотруднике из кэша, если они есть
-        return orjson.loads(cached_data)
+    speculative = settings.CACHE_SPECULATIVE_FETCH
 
-    # Запрос данных о сотруднике из базы данных
-    employee = await get_employee(session=session, employee_id=employee_id)
-    if not employee:
-        raise HTTPException(status_code=404, detail='Employee not found')
+    # Запрос данных о сотруднике из базы данных при отсутствии их в кэше
+    # Параллельный запрос (speculative) выполняется в отдельной сессии: при
+    # попадании в кэш он завершается в фоне, уже после закрытия сессии
+    # обработчика
+    async def fetch_employee() -> bytes | None:
+        if speculative:
+            async with async_session() as own_session:
+                employee = await get_employee(own_session, employee_id)
+        else:
+            employee = await get_employee(session, employee_id)
+        if not employee:
+            return None
+        return _EMP_ADAPTER.dump_json(employee)
 
-    # Сохранение данных о сотруднике в кэше
-    await redis.set(
+    # Данные из кэша (в памяти процесса или Redis) возвращаются как есть
+    payload = await cached_or_fetch(
+        redis,
         cache_key,
-        employee.model_dump_json(),
-        ex=settings.CACHE_EXPIRATION_TIME,
+        fetch_employee,
+        settings.CACHE_EXPIRATION_TIME,
+        local=True,
+        speculative=speculative,
     )
+    if payload is None:
+        raise HTTPException(status_code=404, detail='Employee not found')
 
-    return employee
+    return RawJSONResponse(payload)
 
 
 # Удаление сотрудника
@@ -194,13 +249,22 @@ async def delete_employee_endpoint(
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),  # Добавляем зависимость от Redis
 ) -> None:
-    # Очистка кэша сотрудника перед удалением
-    cache_key = get_employee_cache_key(employee_id)
-    await redis.delete(cache_key)
-
-    employee = await delete_employee(session=session, employee_id=employee_id)
-    if not employee:
+    vacation_ids = await delete_employee(
+        session=session, employee_id=employee_id
+    )
+    if vacation_ids is None:
         raise HTTPException(status_code=404, detail='Employee not found')
 
+    # Очистка кэша сотрудника, его отпусков и списков после удаления (вместе
+    # с сотрудником удаляются и его отпуска)
+    await invalidate_cache(
+        redis,
+        [
+            get_employee_cache_key(employee_id),
+            *map(get_vacation_cache_key, vacation_ids),
+        ],
+        index_keys=[EMPLOYEE_LIST_INDEX_KEY, VACATION_LIST_INDEX_KEY],
+    )
+
     # Возврат статуса 204 No Content в случае успешного удаления
     return None
@@ -1,19 +1,23 @@
 from typing import List, Optional  # Импорт типов для аннотаций
 
-import orjson  # Импорт библиотеки для сериализации/десериализации JSON
-from fastapi import Depends, HTTPException, Query, status  # Импорт классов и функций FastAPI
+from fastapi import Depends, HTTPException, Query, Request, status  # Импорт классов и функций FastAPI
 from fastapi.responses import ORJSONResponse  # Импорт класса для создания JSON-ответов
+from pydantic import TypeAdapter  # Импорт адаптера для сериализации коллекций Pydantic моделей
 from redis.asyncio import Redis  # Импорт асинхронного клиента Redis
 from sqlalchemy.ext.asyncio import AsyncSession  # Импорт асинхронной сессии SQLAlchemy
 
 from conf.config import settings  # Импорт настроек приложения
 from webapp.api.vacation.router import vacation_router  # Импорт роутера для отпусков
+from webapp.cache.compression import compress_payload  # Импорт функции для сжатия данных кэша
+from webapp.cache.invalidation import invalidate_cache  # Импорт функции для инвалидации кэша
 from webapp.cache.key_builder import (  # Импорт функций для построения ключей кэша
-    MAIN_KEY,
+    VACATION_LIST_INDEX_KEY,
+    get_employee_cache_key,
     get_vacation_cache_key,
     get_vacation_list_cache_key,
     get_vacation_pending_list_cache_key,
 )
+from webapp.cache.single_flight import cached_or_fetch  # Импорт функции для получения данных из кэша или базы данных
 from webapp.crud.vacation import (  # Импорт функций для выполнения операций CRUD с отпусками
     create_vacation,
     delete_vacation,
@@ -32,50 +36,62 @@ from webapp.schema.vacation.vacation import (  # Импорт моделей о
 )
 from webapp.utils.auth.user import get_current_user  # Импорт функции для получения текущего пользователя
 from webapp.utils.decorator import measure_integration_latency  # Импорт декоратора для измерения времени выполнения
+from webapp.utils.response import (  # Импорт классов и функций для отдачи готового JSON
+    RawJSONResponse,
+    cached_json_response,
+)
+
+# Адаптеры для сериализации отпусков сразу в байты JSON
+_VAC_ADAPTER = TypeAdapter(Vacation)
+_VAC_LIST_ADAPTER = TypeAdapter(List[Vacation])
 
 
 # Получение списка всех отпусков с учетом фильтров
+# Для следующей страницы передается after_id - id последнего отпуска
 # При отсутствии кэша - запрос к базе данных и сохранение результатов в кэше
 @measure_integration_latency(
     method_name='get_vacations_endpoint', integration_point='endpoint'
 )
 @vacation_router.get(
     '/',
-    response_model=List[Vacation],
+    responses={200: {'model': List[Vacation]}},
     tags=['Vacation'],
     response_class=ORJSONResponse,
 )
 async def get_vacations_endpoint(
+    request: Request,
     approved: Optional[bool] = None,
     skip: int = Query(0, alias='offset'),
     limit: int = Query(10, alias='limit'),
+    after_id: Optional[int] = Query(None, alias='after_id'),
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),
-) -> List[Vacation]:
+) -> RawJSONResponse:
     # Генерация ключа кэша на основе параметров запроса
     cache_key = get_vacation_list_cache_key(
-        approved=approved, skip=skip, limit=limit
+        approved=approved, skip=skip, limit=limit, after_id=after_id
     )
 
-    # Проверка наличия данных в кэше
-    cached_data = await redis.get(cache_key)
-    if cached_data:
-        # Возврат данных из кэша
-        return orjson.loads(cached_data)
-
-    # Запрос данных из базы данных
-    vacations = await get_vacations(
-        session=session, approved=approved, skip=skip, limit=limit
-    )
+    # Запрос данных из базы данных при отсутствии их в кэше
+    async def fetch_vacations() -> bytes:
+        vacations = await get_vacations(
+            session=session,
+            approved=approved,
+            skip=skip,
+            limit=limit,
+            after_id=after_id,
+        )
+        return compress_payload(_VAC_LIST_ADAPTER.dump_json(vacations))
 
-    # Сохранение результатов запроса в кэше
-    await redis.hset(
-        MAIN_KEY,
+    # Ключ списка попадает в индекс для инвалидации при изменении отпусков
+    payload = await cached_or_fetch(
+        redis,
         cache_key,
-        orjson.dumps([vac.model_dump() for vac in vacations]),
+        fetch_vacations,
+        settings.CACHE_EXPIRATION_TIME,
+        index_key=VACATION_LIST_INDEX_KEY,
     )
-    await redis.expire(MAIN_KEY, settings.CACHE_EXPIRATION_TIME)
-    return vacations
+    return cached_json_response(payload, request)
 
 
 # Получение списка отпусков, ожидающих рассмотрения
@@ -85,30 +101,36 @@ async def get_vacations_endpoint(
 )
 @vacation_router.get(
     '/pending',
-    response_model=List[Vacation],
+    responses={200: {'model': List[Vacation]}},
     tags=['Vacation'],
     response_class=ORJSONResponse,
 )
 async def get_pending_vacations_endpoint(
+    request: Request,
     skip: int = Query(0, alias='offset'),
     limit: int = Query(10, alias='limit'),
+    after_id: Optional[int] = Query(None, alias='after_id'),
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),
-) -> List[Vacation]:
-    cache_key = get_vacation_pending_list_cache_key(skip=skip, limit=limit)
-    cached_data = await redis.get(cache_key)
+) -> RawJSONResponse:
+    cache_key = get_vacation_pending_list_cache_key(
+        skip=skip, limit=limit, after_id=after_id
+    )
 
-    if cached_data:
-        return orjson.loads(cached_data)
+    async def fetch_pending_vacations() -> bytes:
+        pending_vacations = await get_pending_vacations(
+            session, skip, limit, after_id
+        )
+        return compress_payload(_VAC_LIST_ADAPTER.dump_json(pending_vacations))
 
-    pending_vacations = await get_pending_vacations(session, skip, limit)
-    await redis.hset(
-        MAIN_KEY,
+    payload = await cached_or_fetch(
+        redis,
         cache_key,
-        orjson.dumps([vac.model_dump() for vac in pending_vacations]),
+        fetch_pending_vacations,
+        settings.CACHE_EXPIRATION_TIME,
+        index_key=VACATION_LIST_INDEX_KEY,
     )
-    await redis.expire(MAIN_KEY, settings.CACHE_EXPIRATION_TIME)
-    return pending_vacations
+    return cached_json_response(payload, request)
 
 
 # Получение деталей отпуска по его идентификатору
@@ -118,7 +140,7 @@ async def get_pending_vacations_endpoint(
 )
 @vacation_router.get(
     '/{vacation_id}',
-    response_model=Vacation,
+    responses={200: {'model': Vacation}},
     tags=['Vacation'],
     response_class=ORJSONResponse,
 )
@@ -126,23 +148,25 @@ async def get_vacation_endpoint(
     vacation_id: int,
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),
-) -> Vacation:
+) -> RawJSONResponse:
     cache_key = get_vacation_cache_key(vacation_id=vacation_id)
-    cached_vacation = await redis.get(cache_key)
 
-    if cached_vacation:
-        return orjson.loads(cached_vacation)
+    async def fetch_vacation() -> bytes | None:
+        vacation = await get_vacation(session, vacation_id)
+        if not vacation:
+            return None
+        return _VAC_ADAPTER.dump_json(vacation)
 
-    vacation = await get_vacation(session, vacation_id)
-    if not vacation:
-        raise HTTPException(status_code=404, detail='Vacation not found')
-    await redis.hset(
-        MAIN_KEY,
+    payload = await cached_or_fetch(
+        redis,
         cache_key,
-        orjson.dumps(vacation.model_dump()),
+        fetch_vacation,
+        settings.CACHE_EXPIRATION_TIME,
+        local=True,
     )
-    await redis.expire(MAIN_KEY, settings.CACHE_EXPIRATION_TIME)
-    return vacation
+    if payload is None:
+        raise HTTPException(status_code=404, detail='Vacation not found')
+    return RawJSONResponse(payload)
 
 
 # Создание нового отпуска администратором
@@ -152,8 +176,8 @@ async def get_vacation_endpoint(
 )
 @vacation_router.post(
     '/',
-    response_model=Vacation,
     status_code=status.HTTP_201_CREATED,
+    responses={201: {'model': Vacation}},
     tags=['Vacation'],
     response_class=ORJSONResponse,
 )
@@ -161,10 +185,19 @@ async def create_vacation_endpoint(
     vacation_data: VacationCreate,
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),
-) -> Vacation:
+) -> RawJSONResponse:
     new_vacation = await create_vacation(session, vacation_data.model_dump())
-    await redis.delete(MAIN_KEY)
-    return new_vacation
+    # Инвалидируем списки отпусков и сотрудника, в данные которого входят
+    # отпуска
+    await invalidate_cache(
+        redis,
+        [get_employee_cache_key(new_vacation.employee_id)],
+        index_keys=[VACATION_LIST_INDEX_KEY],
+    )
+    return RawJSONResponse(
+        _VAC_ADAPTER.dump_json(new_vacation),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 # Запрос на отпуск от сотрудника
@@ -174,8 +207,8 @@ async def create_vacation_endpoint(
 )
 @vacation_router.post(
     '/vacation-requests',
-    response_model=Vacation,
     status_code=status.HTTP_201_CREATED,
+    responses={201: {'model': Vacation}},
     tags=['Vacation'],
     response_class=ORJSONResponse,
 )
@@ -184,25 +217,33 @@ async def vacation_request_endpoint(
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),
-) -> Vacation:
+) -> RawJSONResponse:
     vacation_data = vacation_request.model_dump()
     vacation_data['employee_id'] = current_user.id
     vacation_data['approved'] = None
 
     new_vacation = await create_vacation(session, vacation_data)
-    await redis.delete(MAIN_KEY)
-    return new_vacation
+    await invalidate_cache(
+        redis,
+        [get_employee_cache_key(new_vacation.employee_id)],
+        index_keys=[VACATION_LIST_INDEX_KEY],
+    )
+    return RawJSONResponse(
+        _VAC_ADAPTER.dump_json(new_vacation),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 # Подтверждение/отклонение отпуска администратором
-# После обновления статуса отпуска - инвалидация кэша для данного отпуска
+# После обновления статуса отпуска - инвалидация кэша для данного отпуска,
+# его сотрудника и списков
 @measure_integration_latency(
     method_name='update_vacation_approval_endpoint',
     integration_point='endpoint',
 )
 @vacation_router.put(
     '/{vacation_id}/approval',
-    response_model=Vacation,
+    responses={200: {'model': Vacation}},
     tags=['Vacation'],
     response_class=ORJSONResponse,
 )
@@ -211,18 +252,25 @@ async def update_vacation_approval_endpoint(
     approved: bool,
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),
-) -> (Vacation | None):
+) -> RawJSONResponse:
     updated_vacation = await update_vacation_approval(
         session, vacation_id, approved
     )
-    # Инвалидируем кэш для этого отпуска
-    cache_key = get_vacation_cache_key(vacation_id)
-    await redis.delete(cache_key)
-    return updated_vacation
+    # Инвалидируем кэш для этого отпуска, его сотрудника и списков отпусков
+    cache_keys = [get_vacation_cache_key(vacation_id)]
+    if updated_vacation:
+        cache_keys.append(get_employee_cache_key(updated_vacation.employee_id))
+    await invalidate_cache(
+        redis, cache_keys, index_keys=[VACATION_LIST_INDEX_KEY]
+    )
+    if not updated_vacation:
+        raise HTTPException(status_code=404, detail='Vacation not found')
+    return RawJSONResponse(_VAC_ADAPTER.dump_json(updated_vacation))
 
 
 # Удаление отпуска
-# После удаления отпуска - инвалидация кэша для данного отпуска
+# После удаления отпуска - инвалидация кэша для данного отпуска, его
+# сотрудника и списков
 @measure_integration_latency(
     method_name='delete_vacation_endpoint', integration_point='endpoint'
 )
@@ -237,8 +285,12 @@ async def delete_vacation_endpoint(
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),
 ) -> None:
-    await delete_vacation(session, vacation_id)
-    # Инвалидируем кэш для этого отпуска
-    cache_key = get_vacation_cache_key(vacation_id)
-    await redis.delete(cache_key)
+    employee_id = await delete_vacation(session, vacation_id)
+    # Инвалидируем кэш для этого отпуска, его сотрудника и списков отпусков
+    cache_keys = [get_vacation_cache_key(vacation_id)]
+    if employee_id is not None:
+        cache_keys.append(get_employee_cache_key(employee_id))
+    await invalidate_cache(
+        redis, cache_keys, index_keys=[VACATION_LIST_INDEX_KEY]
+    )
     return None
@@ -0,0 +1,30 @@
+import zlib
+
+from conf.config import settings
+
+# Признак сжатого значения в кэше. JSON всегда начинается с '[' или '{',
+# поэтому значения без префикса (в том числе записанные ранее) - несжатые.
+_ZLIB_PREFIX = b'\x01'
+
+
+# Сжатие сериализованных данных перед записью в кэш
+# Небольшие значения сохраняются как есть: выигрыш от сжатия меньше затрат
+def compress_payload(payload: bytes) -> bytes:
+    if len(payload) < settings.CACHE_COMPRESS_MIN_SIZE:
+        return payload
+    return _ZLIB_PREFIX + zlib.compress(payload, 1)
+
+
+def is_compressed(payload: bytes) -> bool:
+    return payload[:1] == _ZLIB_PREFIX
+
+
+# Данные в формате zlib без префикса (совпадает с Content-Encoding: deflate)
+def get_deflate_body(payload: bytes) -> bytes:
+    return payload[1:]
+
+
+def decompress_payload(payload: bytes) -> bytes:
+    if is_compressed(payload):
+        return zlib.decompress(payload[1:])
+    return payload
@@ -0,0 +1,42 @@
+from typing import Iterable
+
+from redis.asyncio import Redis
+
+from webapp.cache.local import local_cache
+
+
+# Инвалидация ключей кэша и всех ключей, собранных в индексах index_keys
+# Содержимое индексов читается одним пайплайном, после чего ключи удаляются
+# вторым. Из индексов удаляются только прочитанные ключи, а не индексы
+# целиком: ключ, добавленный в индекс между чтением и удалением, останется
+# в индексе и будет найден следующей инвалидацией. Записи в памяти текущего
+# процесса удаляются сразу, остальные процессы обновят их по истечении
+# времени жизни.
+async def invalidate_cache(
+    redis: Redis,
+    cache_keys: Iterable[str] = (),
+    index_keys: Iterable[str] = (),
+) -> None:
+    keys_to_delete = set(cache_keys)
+    for cache_key in keys_to_delete:
+        local_cache.pop(cache_key)
+
+    index_members = {}
+    index_keys = list(index_keys)
+    if index_keys:
+        async with redis.pipeline(transaction=False) as pipe:
+            for index_key in index_keys:
+                pipe.zrange(index_key, 0, -1)
+            for index_key, members in zip(index_keys, await pipe.execute()):
+                if members:
+                    index_members[index_key] = members
+                    keys_to_delete.update(members)
+
+    if not keys_to_delete:
+        return
+
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.delete(*keys_to_delete)
+        for index_key, members in index_members.items():
+            pipe.zrem(index_key, *members)
+        await pipe.execute()
@@ -1,21 +1,54 @@
 from conf.config import settings
 
-MAIN_KEY = f'{settings.REDIS_SIRIUS_CACHE_PREFIX}:vacations'
+# Префикс и шаблоны ключей вычисляются один раз при импорте модуля
+_PREFIX = settings.REDIS_SIRIUS_CACHE_PREFIX
+_EMPLOYEE_TPL = _PREFIX + ':employee_cache:%d'
+_EMPLOYEE_LIST_TPL = _PREFIX + ':employees:%d:%d'
+_EMPLOYEE_LIST_AFTER_TPL = _PREFIX + ':employees:after:%d:%d'
+_VACATION_TPL = _PREFIX + ':vacation_cache:%d'
+_VACATION_LIST_TPL = _PREFIX + ':vacations:%s:%d:%d'
+_VACATION_LIST_AFTER_TPL = _PREFIX + ':vacations:%s:after:%d:%d'
+_VACATION_PENDING_LIST_TPL = _PREFIX + ':pending:vacations:%d:%d'
+_VACATION_PENDING_LIST_AFTER_TPL = _PREFIX + ':pending:vacations:after:%d:%d'
+
+# Индексы ключей закэшированных списков (для инвалидации)
+# Индексы хранятся как отсортированные множества (ZSET)
+EMPLOYEE_LIST_INDEX_KEY = _PREFIX + ':employees:zindex'
+VACATION_LIST_INDEX_KEY = _PREFIX + ':vacations:zindex'
 
 
 def get_employee_cache_key(employee_id: int) -> str:
-    return f'{settings.REDIS_SIRIUS_CACHE_PREFIX}:employee_cache:{employee_id}'
+    return _EMPLOYEE_TPL % employee_id
+
+
+# При keyset-пагинации (after_id) страница определяется курсором, а не skip
+def get_employee_list_cache_key(
+    skip: int, limit: int, after_id: int | None = None
+) -> str:
+    if after_id is not None:
+        return _EMPLOYEE_LIST_AFTER_TPL % (after_id, limit)
+    return _EMPLOYEE_LIST_TPL % (skip, limit)
 
 
 def get_vacation_cache_key(vacation_id: int) -> str:
-    return f'{settings.REDIS_SIRIUS_CACHE_PREFIX}:vacation_cache:{vacation_id}'
+    return _VACATION_TPL % vacation_id
 
 
 def get_vacation_list_cache_key(
-    approved: bool | None, skip: int, limit: int
+    approved: bool | None, skip: int, limit: int, after_id: int | None = None
+) -> str:
+    if after_id is not None:
+        return _VACATION_LIST_AFTER_TPL % (approved, after_id, limit)
+    return _VACATION_LIST_TPL % (approved, skip, limit)
+
+
+def get_vacation_pending_list_cache_key(
+    skip: int, limit: int, after_id: int | None = None
 ) -> str:
-    return f'{settings.REDIS_SIRIUS_CACHE_PREFIX}:vacations:{approved}:{skip}:{limit}'
+    if after_id is not None:
+        return _VACATION_PENDING_LIST_AFTER_TPL % (after_id, limit)
+    return _VACATION_PENDING_LIST_TPL % (skip, limit)
 
 
-def get_vacation_pending_list_cache_key(skip: int, limit: int) -> str:
-    return f'{settings.REDIS_SIRIUS_CACHE_PREFIX}:pending:vacations:{skip}:{limit}'
+def get_cache_lock_key(cache_key: str) -> str:
+    return cache_key + ':lock'
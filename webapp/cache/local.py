@@ -0,0 +1,47 @@
+from collections import OrderedDict
+from time import monotonic
+
+from conf.config import settings
+
+
+# Ограниченный по размеру кэш в памяти процесса с временем жизни записей
+# Используется перед Redis для часто запрашиваемых сущностей: чтение из него
+# не требует обращения по сети. Все операции синхронные, поэтому в рамках
+# одного цикла событий блокировки не нужны.
+class LocalTTLCache:
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        self._data[key] = (monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        # Вытесняем давно не использованные записи
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+local_cache = LocalTTLCache(
+    maxsize=settings.LOCAL_CACHE_MAXSIZE,
+    ttl=settings.LOCAL_CACHE_EXPIRATION_TIME,
+)
@@ -0,0 +1,227 @@
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Coroutine
+
+from redis.asyncio import Redis
+
+from conf.config import settings
+from webapp.cache.key_builder import get_cache_lock_key
+from webapp.cache.local import local_cache
+
+logger = logging.getLogger(__name__)
+
+# Интервал опроса кэша, пока данные запрашивает другой процесс
+LOCK_POLL_INTERVAL = 0.02
+
+FetcherT = Callable[[], Awaitable[bytes | None]]
+
+# Запросы к источнику данных, уже выполняющиеся в текущем процессе
+_inflight: dict[str, asyncio.Future[bytes | None]] = {}
+
+# Фоновые задачи: записи в кэш и невостребованные запросы к источнику
+# (ссылки хранятся, чтобы задачи не собрал GC)
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+def _on_background_task_done(task: asyncio.Task[Any]) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error('Background cache task failed', exc_info=task.exception())
+
+
+def _track_background_task(task: asyncio.Task[Any]) -> None:
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+
+
+# Запись в кэш выполняется в фоне: ответ клиенту не ждет обращения к Redis
+def _run_in_background(coro: Coroutine[Any, Any, Any]) -> None:
+    _track_background_task(asyncio.create_task(coro))
+
+
+async def _store(
+    redis: Redis,
+    cache_key: str,
+    payload: bytes | None,
+    ttl: int,
+    index_key: str | None,
+    lock_key: str | None = None,
+) -> None:
+    if index_key is None and lock_key is None:
+        if payload is not None:
+            await redis.set(cache_key, payload, ex=ttl)
+        return
+
+    # Ключ добавляется в индекс, чтобы его можно было точечно инвалидировать.
+    # Индекс - отсортированное множество с временем истечения ключей в
+    # качестве оценки: при каждой записи из него удаляются истекшие ключи,
+    # поэтому размер индекса ограничен числом живых ключей. Сам индекс живет
+    # не меньше любого из своих ключей. Блокировка снимается только после
+    # записи, чтобы ожидающие процессы нашли данные в кэше.
+    async with redis.pipeline(transaction=False) as pipe:
+        if payload is not None:
+            pipe.set(cache_key, payload, ex=ttl)
+            if index_key is not None:
+                now = time.time()
+                pipe.zremrangebyscore(index_key, '-inf', now)
+                pipe.zadd(index_key, {cache_key: now + ttl})
+                pipe.expire(index_key, ttl)
+        if lock_key is not None:
+            pipe.delete(lock_key)
+        await pipe.execute()
+
+
+async def _fetch_with_lock(
+    redis: Redis,
+    cache_key: str,
+    fetcher: FetcherT,
+    ttl: int,
+    index_key: str | None,
+) -> bytes | None:
+    lock_key = get_cache_lock_key(cache_key)
+    locked = await redis.set(
+        lock_key, 1, nx=True, ex=settings.CACHE_LOCK_EXPIRATION_TIME
+    )
+
+    if locked:
+        try:
+            payload = await fetcher()
+        except BaseException:
+            _run_in_background(redis.delete(lock_key))
+            raise
+        _run_in_background(
+            _store(redis, cache_key, payload, ttl, index_key, lock_key)
+        )
+        return payload
+
+    # Данные уже запрашивает другой процесс - ждем их появления в кэше,
+    # пока блокировка не будет снята или не истечет
+    while True:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        cached_data = await redis.get(cache_key)
+        if cached_data:
+            return cached_data
+        if not await redis.exists(lock_key):
+            break
+
+    # Другой процесс не сохранил данные (ошибка или пустой результат)
+    payload = await fetcher()
+    if payload is not None:
+        _run_in_background(_store(redis, cache_key, payload, ttl, index_key))
+    return payload
+
+
+# Получение данных из кэша или из источника с защитой от "cache stampede"
+# При промахе кэша данные запрашивает только один обработчик: внутри процесса
+# остальные ждут его результат, между процессами - блокировка в Redis.
+# fetcher возвращает сериализованные данные или None, если их нет.
+# С local=True данные дополнительно кэшируются в памяти процесса.
+# С speculative=True запрос к источнику начинается одновременно с чтением
+# из Redis (см. _get_speculative).
+async def cached_or_fetch(
+    redis: Redis,
+    cache_key: str,
+    fetcher: FetcherT,
+    ttl: int,
+    index_key: str | None = None,
+    local: bool = False,
+    speculative: bool = False,
+) -> bytes | None:
+    if local:
+        cached_data = local_cache.get(cache_key)
+        if cached_data is not None:
+            return cached_data
+
+    if speculative:
+        payload = await _get_speculative(
+            redis, cache_key, fetcher, ttl, index_key
+        )
+    else:
+        payload = await _get_single_flight(
+            redis, cache_key, fetcher, ttl, index_key
+        )
+    if local and payload is not None:
+        local_cache.set(cache_key, payload)
+    return payload
+
+
+async def _cancel_task(task: asyncio.Task[Any]) -> None:
+    task.cancel()
+    # Дожидаемся завершения отмены, чтобы задача не пережила вызывающий код
+    await asyncio.gather(task, return_exceptions=True)
+
+
+# Чтение из Redis и запрос к источнику выполняются параллельно: при промахе
+# задержка сокращается на время обращения к Redis. Имеет смысл только при
+# высокой доле промахов.
+# При попадании запрос к источнику не отменяется, а завершается в фоне и его
+# результат отбрасывается: отмена выполняющегося запроса asyncpg приводит к
+# закрытию соединения с БД. Поэтому fetcher не должен использовать ресурсы
+# обработчика (например, его сессию БД) - они могут быть закрыты раньше.
+async def _get_speculative(
+    redis: Redis,
+    cache_key: str,
+    fetcher: FetcherT,
+    ttl: int,
+    index_key: str | None,
+) -> bytes | None:
+    fetch_task = asyncio.create_task(fetcher())
+    try:
+        cached_data = await redis.get(cache_key)
+    except BaseException:
+        await _cancel_task(fetch_task)
+        raise
+
+    if cached_data:
+        _track_background_task(fetch_task)
+        return cached_data
+
+    payload = await fetch_task
+    if payload is not None:
+        _run_in_background(_store(redis, cache_key, payload, ttl, index_key))
+    return payload
+
+
+async def _get_single_flight(
+    redis: Redis,
+    cache_key: str,
+    fetcher: FetcherT,
+    ttl: int,
+    index_key: str | None,
+) -> bytes | None:
+    cached_data = await redis.get(cache_key)
+    if cached_data:
+        return cached_data
+
+    while (inflight := _inflight.get(cache_key)) is not None:
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # Повторяем попытку, только если был отменен чужой запрос
+            current_task = asyncio.current_task()
+            if not inflight.cancelled() or (
+                current_task is not None and current_task.cancelling()
+            ):
+                raise
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[bytes | None] = loop.create_future()
+    _inflight[cache_key] = future
+    try:
+        payload = await _fetch_with_lock(
+            redis, cache_key, fetcher, ttl, index_key
+        )
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        # Исключение получает вызывающий код, ожидающих может и не быть
+        future.exception()
+        raise
+    else:
+        future.set_result(payload)
+        return payload
+    finally:
+        del _inflight[cache_key]
@@ -1,17 +1,24 @@
-from typing import List, Literal, Sequence  # Импорт типов данных
+from typing import List, Optional, Sequence  # Импорт типов данных
 
-from sqlalchemy import select  # Импорт функции select из библиотеки SQLAlchemy
+from pydantic import TypeAdapter  # Импорт адаптера для валидации коллекций Pydantic моделей
+from sqlalchemy import delete, select, update  # Импорт функций delete, select и update из библиотеки SQLAlchemy
 from sqlalchemy.ext.asyncio import AsyncSession  # Импорт асинхронной сессии SQLAlchemy
 from sqlalchemy.orm import selectinload  # Импорт функции selectinload для предзагрузки связанных данных
 
+from webapp.crud.pagination import paginate  # Импорт функции для пагинации запросов
 from webapp.models.sirius.employee import Employee  # Импорт модели Employee из модуля webapp.models.sirius.employee
+from webapp.models.sirius.user import User  # Импорт модели User из модуля webapp.models.sirius.user
 from webapp.models.sirius.vacation import Vacation  # Импорт модели Vacation из модуля webapp.models.sirius.vacation
-from webapp.schema.employee.employee import (  # Импорт Pydantic моделей Employee и EmployeeCreate
+from webapp.schema.employee.employee import (  # Импорт Pydantic моделей сотрудников
     Employee as EmployeePydantic,
     EmployeeCreate,
+    EmployeeListItem,
 )
 from webapp.utils.decorator import measure_integration_latency  # Импорт декоратора для измерения времени выполнения
 
+# Адаптер для валидации списков ORM-объектов за один вызов pydantic-core
+_EMP_LIST_ITEM_PY_LIST = TypeAdapter(List[EmployeeListItem])
+
 
 # Получение сотрудника по его ID
 # Функция делает запрос к базе данных для получения сотрудника по его ID,
@@ -21,33 +28,39 @@ from webapp.utils.decorator import measure_integration_latency  # Импорт 
 )
 async def get_employee(
     session: AsyncSession, employee_id: int
-) -> EmployeePydantic:
-    result = await session.execute(
-        select(Employee)
-        .options(selectinload(Employee.vacations))
-        .where(Employee.id == employee_id)
-    )
-    employee = result.unique().scalars().one_or_none()
+) -> Optional[EmployeePydantic]:
+    employee = (
+        await session.scalars(
+            select(Employee)
+            .options(selectinload(Employee.vacations))
+            .where(Employee.id == employee_id)
+        )
+    ).one_or_none()
+    if employee is None:
+        return None
     return EmployeePydantic.model_validate(employee)
 
 
-# Получение списка всех сотрудников с возможностью пагинации
-# Функция делает запрос к базе данных для получения всех сотрудников,
-# включая загрузку связанных отпусков, с возможностью пропуска и ограничения для пагинации.
+# Получение списка сотрудников без связанных отпусков с возможностью пагинации
+# Отпуска для списка не загружаются, поэтому к базе данных выполняется
+# только один запрос.
 @measure_integration_latency(
-    method_name='get_employees', integration_point='database'
+    method_name='get_employees_light', integration_point='database'
 )
-async def get_employees(
-    session: AsyncSession, skip: int, limit: int
-) -> List[EmployeePydantic]:
-    result = await session.execute(
-        select(Employee)
-        .options(selectinload(Employee.vacations))
-        .offset(skip)
-        .limit(limit)
+async def get_employees_light(
+    session: AsyncSession,
+    skip: int,
+    limit: int,
+    after_id: Optional[int] = None,
+) -> List[EmployeeListItem]:
+    employees = (
+        await session.scalars(
+            paginate(select(Employee), Employee.id, skip, limit, after_id)
+        )
+    ).all()
+    return _EMP_LIST_ITEM_PY_LIST.validate_python(
+        employees, from_attributes=True
     )
-    employees = result.unique().scalars().all()
-    return [EmployeePydantic.model_validate(emp) for emp in employees]
 
 
 # Создание нового сотрудника
@@ -66,25 +79,34 @@ async def create_employee(
 
 
 # Обновление данных существующего сотрудника
-# Функция обновляет данные существующего сотрудника в базе данных.
+# Функция обновляет данные существующего сотрудника одним запросом
+# UPDATE ... RETURNING, после чего отдельно загружает его отпуска для ответа.
+# Ответ формируется до commit: после него атрибуты ORM-объекта истекают.
 @measure_integration_latency(
     method_name='update_employee', integration_point='database'
 )
 async def update_employee(
     session: AsyncSession, employee_id: int, update_data: dict[str, bool]
-) -> (Employee | None):
-    result = await session.execute(
-        select(Employee)
-        .options(selectinload(Employee.vacations))
-        .where(Employee.id == employee_id)
-    )
-    employee = result.unique().scalars().one_or_none()
-    if employee:
-        for key, value in update_data.items():
-            setattr(employee, key, value)
-        await session.commit()
-        await session.refresh(employee, attribute_names=['vacations'])
-    return employee
+) -> Optional[EmployeePydantic]:
+    if not update_data:
+        return await get_employee(session, employee_id)
+
+    employee = (
+        await session.scalars(
+            update(Employee)
+            .where(Employee.id == employee_id)
+            .values(**update_data)
+            .returning(Employee)
+        )
+    ).one_or_none()
+    if employee is None:
+        await session.rollback()
+        return None
+
+    await employee.awaitable_attrs.vacations
+    updated_employee = EmployeePydantic.model_validate(employee)
+    await session.commit()
+    return updated_employee
 
 
 # Получение списка отпусков для конкретного сотрудника
@@ -93,30 +115,50 @@ async def update_employee(
     method_name='get_vacations_for_employee', integration_point='database'
 )
 async def get_vacations_for_employee(
-    session: AsyncSession, employee_id: int, skip: int, limit: int
+    session: AsyncSession,
+    employee_id: int,
+    skip: int,
+    limit: int,
+    after_id: Optional[int] = None,
 ) -> Sequence[Vacation]:
-    result = await session.execute(
-        select(Vacation)
-        .where(Vacation.employee_id == employee_id)
-        .offset(skip)
-        .limit(limit)
-    )
-    return result.scalars().all()
+    query = select(Vacation).where(Vacation.employee_id == employee_id)
+    return (
+        await session.scalars(
+            paginate(query, Vacation.id, skip, limit, after_id)
+        )
+    ).all()
 
 
 # Удаление сотрудника
-# Функция удаляет сотрудника из базы данных по его ID.
+# Функция удаляет сотрудника из базы данных по его ID запросами DELETE без
+# предварительного SELECT. Каскадное удаление отпусков и учетной записи
+# пользователя, которое раньше выполняла ORM, выполняется явно.
+# Возвращает ID удаленных отпусков для инвалидации их кэша или None, если
+# сотрудник не найден.
 @measure_integration_latency(
     method_name='delete_employee', integration_point='database'
 )
 async def delete_employee(
     session: AsyncSession, employee_id: int
-) -> Literal[True]:
-    result = await session.execute(
-        select(Employee).where(Employee.id == employee_id)
-    )
-    employee = result.scalars().one_or_none()
-    if employee:
-        await session.delete(employee)
-        await session.commit()
-    return True
+) -> Optional[Sequence[int]]:
+    vacation_ids = (
+        await session.scalars(
+            delete(Vacation)
+            .where(Vacation.employee_id == employee_id)
+            .returning(Vacation.id)
+        )
+    ).all()
+    user_id = (
+        await session.execute(
+            delete(Employee)
+            .where(Employee.id == employee_id)
+            .returning(Employee.user_id)
+        )
+    ).scalar_one_or_none()
+    if user_id is None:
+        await session.rollback()
+        return None
+
+    await session.execute(delete(User).where(User.id == user_id))
+    await session.commit()
+    return vacation_ids
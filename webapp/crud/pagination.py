@@ -0,0 +1,27 @@
+from typing import Any, Optional, TypeVar  # Импорт типов данных
+
+from sqlalchemy import (  # Импорт класса запроса SELECT из библиотеки SQLAlchemy
+    Select,
+)
+from sqlalchemy.orm import (  # Импорт класса атрибута ORM-модели
+    InstrumentedAttribute,
+)
+
+SelectT = TypeVar('SelectT', bound=Select[Any])
+
+
+# Пагинация запроса по возрастанию id
+# С after_id используется keyset-пагинация (WHERE id > after_id): стоимость
+# запроса не зависит от номера страницы. Без него - прежняя пагинация через
+# OFFSET, при которой база данных читает и отбрасывает skip строк.
+def paginate(
+    query: SelectT,
+    id_column: InstrumentedAttribute[int],
+    skip: int,
+    limit: int,
+    after_id: Optional[int] = None,
+) -> SelectT:
+    query = query.order_by(id_column).limit(limit)
+    if after_id is not None:
+        return query.where(id_column > after_id)
+    return query.offset(skip)
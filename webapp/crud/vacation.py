@@ -1,14 +1,19 @@
-from typing import List, Literal, Optional  # Импорт типов данных
+from typing import List, Optional  # Импорт типов данных
 
-from sqlalchemy import select, update  # Импорт функций select и update из библиотеки SQLAlchemy
+from pydantic import TypeAdapter  # Импорт адаптера для валидации коллекций Pydantic моделей
+from sqlalchemy import delete, select, update  # Импорт функций delete, select и update из библиотеки SQLAlchemy
 from sqlalchemy.ext.asyncio import AsyncSession  # Импорт асинхронной сессии SQLAlchemy
 
+from webapp.crud.pagination import paginate  # Импорт функции для пагинации запросов
 from webapp.models.sirius.vacation import Vacation  # Импорт модели Vacation из модуля webapp.models.sirius.vacation
 from webapp.schema.vacation.vacation import (  # Импорт Pydantic модели Vacation
     Vacation as VacationPydantic
 )
 from webapp.utils.decorator import measure_integration_latency  # Импорт декоратора для измерения времени выполнения
 
+# Адаптер для валидации списков ORM-объектов за один вызов pydantic-core
+_VAC_PY_LIST = TypeAdapter(List[VacationPydantic])
+
 
 # Получение отпуска по его ID
 @measure_integration_latency(
@@ -21,6 +26,8 @@ async def get_vacation(
         select(Vacation).where(Vacation.id == vacation_id)
     )
     vacation = result.scalars().one_or_none()
+    if vacation is None:
+        return None
     return VacationPydantic.model_validate(vacation)
 
 
@@ -33,6 +40,7 @@ async def get_vacations(
     skip: int,
     limit: int,
     approved: Optional[bool] = None,
+    after_id: Optional[int] = None,
 ) -> List[VacationPydantic]:
     query = select(Vacation)
     if approved is not None:
@@ -40,11 +48,11 @@ async def get_vacations(
     else:
         query = query.where(Vacation.approved.isnot(None))
 
-    results = await session.execute(query.offset(skip).limit(limit))
+    results = await session.execute(
+        paginate(query, Vacation.id, skip, limit, after_id)
+    )
     vacations = results.scalars().all()
-    return [
-        VacationPydantic.model_validate(vacation) for vacation in vacations
-    ]
+    return _VAC_PY_LIST.validate_python(vacations, from_attributes=True)
 
 
 # Получение списка отпусков без статуса (ожидающих рассмотрения)
@@ -52,14 +60,17 @@ async def get_vacations(
     method_name='get_pending_vacations', integration_point='database'
 )
 async def get_pending_vacations(
-    session: AsyncSession, skip: int = 0, limit: int = 10
+    session: AsyncSession,
+    skip: int = 0,
+    limit: int = 10,
+    after_id: Optional[int] = None,
 ) -> List[VacationPydantic]:
     query = select(Vacation).where(Vacation.approved.is_(None))
-    results = await session.execute(query.offset(skip).limit(limit))
+    results = await session.execute(
+        paginate(query, Vacation.id, skip, limit, after_id)
+    )
     vacations = results.scalars().all()
-    return [
-        VacationPydantic.model_validate(vacation) for vacation in vacations
-    ]
+    return _VAC_PY_LIST.validate_python(vacations, from_attributes=True)
 
 
 # Создание нового отпуска
@@ -77,20 +88,23 @@ async def create_vacation(
 
 
 # Удаление отпуска
+# Возвращает ID сотрудника, которому принадлежал отпуск (None, если отпуска
+# с таким ID нет), чтобы можно было инвалидировать кэш сотрудника.
 @measure_integration_latency(
     method_name='delete_vacation', integration_point='database'
 )
 async def delete_vacation(
     session: AsyncSession, vacation_id: int
-) -> Literal[True]:
-    result = await session.execute(
-        select(Vacation).where(Vacation.id == vacation_id)
-    )
-    vacation = result.scalars().one_or_none()
-    if vacation:
-        await session.delete(vacation)
-        await session.commit()
-    return True
+) -> Optional[int]:
+    employee_id = (
+        await session.execute(
+            delete(Vacation)
+            .where(Vacation.id == vacation_id)
+            .returning(Vacation.employee_id)
+        )
+    ).scalar_one_or_none()
+    await session.commit()
+    return employee_id
 
 
 # Обновление статуса отпуска (approved)
@@ -108,11 +122,5 @@ async def update_vacation_approval(
     )
     await session.commit()
     # После обновления статуса отпуска, получаем обновленный объект отпуска
-    updated_vacation = await get_vacation(
-        session, vacation_id
-    )  # Используем уже изменённую функцию get_vacation
-    return (
-        VacationPydantic.model_validate(updated_vacation)
-        if updated_vacation
-        else None
-    )
+    # (None, если отпуска с таким ID нет)
+    return await get_vacation(session, vacation_id)
@@ -1,6 +1,6 @@
 from typing import AsyncGenerator
 
-from sqlalchemy import QueuePool
+from sqlalchemy import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -12,11 +12,18 @@ from conf.config import settings
 
 
 def create_engine() -> AsyncEngine:
+    # Короткие параметризованные запросы повторяются постоянно, поэтому
+    # подготовленные выражения кэшируются на соединение, а проверка соединения
+    # при выдаче из пула (лишнее обращение к БД) отключена
     return create_async_engine(
         settings.DB_URL,
-        poolclass=QueuePool,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=False,
         connect_args={
-            'statement_cache_size': 0,
+            'statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+            'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
         },
     )
 
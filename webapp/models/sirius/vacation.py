@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Date, ForeignKey, Integer
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Integer, text
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -7,7 +7,17 @@ from webapp.models.meta import DEFAULT_SCHEMA, Base
 
 class Vacation(Base, AsyncAttrs):
     __tablename__ = 'vacation'
-    __table_args__ = ({'schema': DEFAULT_SCHEMA},)
+    __table_args__ = (
+        # Частичный индекс для пагинации отпусков, ожидающих рассмотрения
+        Index(
+            'ix_vacation_approved_null',
+            'id',
+            postgresql_where=text('approved IS NULL'),
+        ),
+        # Индекс для пагинации отпусков конкретного сотрудника
+        Index('ix_vacation_employee_id_id', 'employee_id', 'id'),
+        {'schema': DEFAULT_SCHEMA},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
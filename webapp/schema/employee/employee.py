@@ -18,8 +18,11 @@ class EmployeeUpdate(EmployeeBase):
     pass
 
 
-class Employee(EmployeeBase):
+class EmployeeListItem(EmployeeBase):
     id: int
-    vacations: List[Vacation] = []
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class Employee(EmployeeListItem):
+    vacations: List[Vacation] = []
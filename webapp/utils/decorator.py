@@ -1,6 +1,6 @@
-import time
 import asyncio
 from functools import wraps
+from time import perf_counter
 
 from webapp.utils.middleware import INTEGRATION_METHOD_LATENCY
 
@@ -8,29 +8,36 @@ from webapp.utils.middleware import INTEGRATION_METHOD_LATENCY
 def measure_integration_latency(method_name, integration_point):
     # Внутренний декоратор
     def decorator(func):
-        # Обертка для измерения времени выполнения функции
-        # wrapper - это оберточная функция, созданная декоратором.
-        # Она использует wraps для того, чтобы сохранить информацию о декорированной функции func.
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            start_time = time.time()  # Засекаем начальное время
+        # Метрика с метками method и integration_point не меняется между
+        # вызовами, поэтому ее метод observe получается один раз при
+        # декорировании
+        observe = INTEGRATION_METHOD_LATENCY.labels(
+            method=method_name, integration_point=integration_point
+        ).observe
+
+        # Обертки для измерения времени выполнения функции
+        # Асинхронность функции проверяется один раз, а не при каждом вызове.
+        # wraps сохраняет информацию о декорированной функции func.
+        if asyncio.iscoroutinefunction(func):
 
-            # Проверяем функцию на асинхронность
-            if asyncio.iscoroutinefunction(func):
-                # вызываем с await, если она асинхронная
+            @wraps(func)
+            async def wrapper_async(*args, **kwargs):
+                start_time = perf_counter()  # Засекаем начальное время
                 result = await func(*args, **kwargs)
-            else:
-                # без await, если синхронная
-                result = func(*args, **kwargs)
+                # Записываем время выполнения в метрику
+                observe(perf_counter() - start_time)
+                return result
 
-            process_time = time.time() - start_time  # Вычисляем время выполнения
-            # Записываем время в метрику с метками method и integration_point
-            INTEGRATION_METHOD_LATENCY.labels(
-                method=method_name, integration_point=integration_point
-            ).observe(process_time)
+            return wrapper_async
 
+        @wraps(func)
+        def wrapper_sync(*args, **kwargs):
+            start_time = perf_counter()  # Засекаем начальное время
+            result = func(*args, **kwargs)
+            # Записываем время выполнения в метрику
+            observe(perf_counter() - start_time)
             return result
 
-        return wrapper
+        return wrapper_sync
 
     return decorator
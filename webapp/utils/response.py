@@ -0,0 +1,42 @@
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from webapp.cache.compression import (
+    decompress_payload,
+    get_deflate_body,
+    is_compressed,
+)
+
+
+# Ответ с уже сериализованным JSON (например, из кэша Redis)
+# Байты отдаются клиенту как есть, без повторного разбора и сериализации
+class RawJSONResponse(Response):
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:
+        return content
+
+
+def _accepts_deflate(accept_encoding: str) -> bool:
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        if coding.strip().lower() != 'deflate':
+            continue
+        # Кодировка с q=0 явно запрещена клиентом
+        return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00')
+    return False
+
+
+# Ответ с данными из кэша, которые могут быть сжаты (см. compress_payload)
+# Если клиент принимает deflate, сжатые данные отдаются без распаковки
+def cached_json_response(payload: bytes, request: Request) -> RawJSONResponse:
+    if not is_compressed(payload):
+        return RawJSONResponse(payload)
+
+    headers = {'Vary': 'Accept-Encoding'}
+    if _accepts_deflate(request.headers.get('accept-encoding', '')):
+        headers['Content-Encoding'] = 'deflate'
+        return RawJSONResponse(get_deflate_body(payload), headers=headers)
+    return RawJSONResponse(decompress_payload(payload), headers=headers)